@@ -7,6 +7,10 @@ import os
 # when using threading/forking (required by HuggingFace tokenizers)
 os.environ["TOKENIZERS_PARALLELISM"] = "false"
 
+# Cap CPU-side thread pools (torch/OpenMP in the processor) so they don't
+# oversubscribe the cores while Metal runs inference; respects a user override
+os.environ.setdefault("OMP_NUM_THREADS", str(max(1, (os.cpu_count() or 2) // 2)))
+
 import sys
 from pathlib import Path
 
@@ -7,9 +7,39 @@ from pathlib import Path
 # MODEL_NAME uses Hugging Face repository ID format: "organization/model-name"
 MODEL_NAME = "lmstudio-community/Qwen3-VL-8B-Instruct-MLX-4bit"
 
+# Model download configuration
+# Number of files fetched in parallel on first download (set to 1 on slow/metered links)
+HF_DOWNLOAD_MAX_WORKERS = 8
+# Only fetch what mlx-vlm needs (skips PyTorch .bin duplicates shipped by some repos)
+HF_DOWNLOAD_ALLOW_PATTERNS = [
+    "*.json",
+    "*.safetensors",
+    "*.txt",
+    "*.model",
+    "*.jinja",
+    "*.py",
+    "tokenizer*",
+]
+
 # Screenshot configuration
 SCREENSHOT_INTERVAL_SECONDS = 1800  # 30 minutes (30 * 60 seconds)
-SCREENSHOT_TEMP_FILE = os.path.expanduser("~/Desktop/screenshot.png")
+# Optional delay before each scheduled capture to let the UI settle (0 = capture immediately).
+# Manual "Capture Now" is never delayed; the menu has closed by the time it runs.
+SCREENSHOT_PRECAPTURE_DELAY_SECONDS = 0
+# Each capture writes a uniquely named file next to this path (e.g. screenshot-x1y2z3.jpg)
+SCREENSHOT_TEMP_FILE = os.path.expanduser("~/Desktop/screenshot.jpg")
+# screencapture is killed if it hasn't finished within this many seconds
+SCREENSHOT_CAPTURE_TIMEOUT_SECONDS = 10
+# Screenshots are downscaled so the long edge fits this many pixels (0 disables),
+# snapped to the vision encoder's patch size. Fewer pixels = fewer vision tokens.
+SCREENSHOT_MAX_DIMENSION = 1344
+SCREENSHOT_PATCH_SIZE = 28  # Qwen3-VL merges 14px patches 2x2
+
+# Inference batching: captures queued within the timeout are described together
+BATCH_MAX_SIZE = 4
+BATCH_TIMEOUT_SECONDS = 0.5
+# Captures waiting for inference; new captures are skipped while this many are queued
+CAPTURE_QUEUE_MAX_SIZE = BATCH_MAX_SIZE
 
 # Output file configuration
 OUTPUT_FILE = os.path.expanduser("~/Desktop/TimeTracking.txt")
@@ -33,6 +63,6 @@ MODEL_NAME_ONLY = MODEL_NAME.split("/")[-1]
 MODEL_PATH = str(Path(__file__).parent / ".models" / MODEL_NAME_ONLY)
 
 # Model inference parameters
-TEMPERATURE = 0.9
-MAX_TOKENS = 500
-FREQUENCY_PENALTY = 1.1
+TEMPERATURE = 0.0  # 0 = greedy decoding
+MAX_TOKENS = 160  # Per image; the prompt asks for at most 500 characters
+FREQUENCY_PENALTY = 1.1  # Passed to mlx-vlm as repetition_penalty
@@ -18,17 +18,16 @@ Usage:
 import argparse
 import signal
 import sys
+import threading
 from pathlib import Path
 from typing import Optional
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.screenshot import ScreenshotService
-from src.model_inference import ModelInferenceService
-from src.tracking import TrackingService
-from src.scheduler import Scheduler
 from src.logging_service import get_logging_service
+from src.scheduler import Scheduler
+from src.workflow import WorkflowEvent, WorkflowRunner
 
 
 class ScreendescribeApp:
@@ -36,42 +35,33 @@ class ScreendescribeApp:
 
     def __init__(self):
         """Initialize the application."""
+        # Imported here so --gui never loads the CLI service stack (PIL, MLX)
+        from src.screenshot import ScreenshotService
+        from src.model_inference import get_model_service
+        from src.tracking import TrackingService
+
         self.screenshot_service = ScreenshotService()
-        self.model_service = ModelInferenceService()
+        self.model_service = get_model_service()
         self.tracking_service = TrackingService()
+        self.workflow_runner = WorkflowRunner(
+            self.screenshot_service,
+            self.model_service,
+            self.tracking_service,
+            on_event=self._on_workflow_event,
+        )
         self.scheduler: Optional[Scheduler] = None
-        self._shutdown_requested = False
+        self._stop_event = threading.Event()
         self.logger = get_logging_service()
 
     def execute_workflow(self) -> None:
         """Execute the complete workflow: screenshot -> inference -> logging."""
-        try:
-            self.logger.info("=" * 60)
-            self.logger.info("Starting workflow execution...")
-
-            # Step 1: Capture screenshot
-            self.logger.info("Step 1: Capturing screenshot...")
-            image = self.screenshot_service.capture()
-            self.logger.info("✓ Screenshot captured successfully")
-
-            # Step 2: Run model inference
-            self.logger.info("Step 2: Running model inference...")
-            description = self.model_service.describe_image(image)
-            self.logger.info(f"✓ Inference completed: {description[:100]}...")
+        self.workflow_runner.run()
 
-            # Step 3: Log to tracking file
-            self.logger.info("Step 3: Logging to tracking file...")
-            self.tracking_service.append_entry(description)
-            self.logger.info("✓ Entry logged successfully")
-
-            self.logger.info("Workflow completed successfully!")
+    def _on_workflow_event(self, event: WorkflowEvent, detail: Optional[str]) -> None:
+        """Frame each workflow run in the console log."""
+        if event in (WorkflowEvent.STARTED, WorkflowEvent.COMPLETED):
             self.logger.info("=" * 60)
 
-        except Exception as e:
-            self.logger.error(f"Error in workflow execution: {e}")
-            import traceback
-            self.logger.error(traceback.format_exc())
-
     def run_scheduled(self, interval: Optional[int] = None) -> None:
         """Run the application in scheduled mode."""
         self.logger.info("Starting in scheduled mode...")
@@ -90,11 +80,9 @@ class ScreendescribeApp:
         # Start scheduler
         self.scheduler.start()
 
-        # Keep main thread alive
+        # Keep main thread alive until a shutdown is requested
         try:
-            while self.scheduler.is_running() and not self._shutdown_requested:
-                import time
-                time.sleep(1)
+            self._stop_event.wait()
         except KeyboardInterrupt:
             pass
         finally:
@@ -109,11 +97,11 @@ class ScreendescribeApp:
     def _signal_handler(self, signum, frame) -> None:
         """Handle shutdown signals."""
         self.logger.info(f"\nReceived signal {signum}, shutting down...")
-        self._shutdown_requested = True
         self._shutdown()
 
     def _shutdown(self) -> None:
         """Shutdown the application gracefully."""
+        self._stop_event.set()
         if self.scheduler:
             self.scheduler.stop()
         self.logger.info("Application stopped.")
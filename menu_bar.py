@@ -7,6 +7,10 @@ import os
 # when using threading/forking (required by HuggingFace tokenizers)
 os.environ["TOKENIZERS_PARALLELISM"] = "false"
 
+# Cap CPU-side thread pools (torch/OpenMP in the processor) so they don't
+# oversubscribe the cores while Metal runs inference; respects a user override
+os.environ.setdefault("OMP_NUM_THREADS", str(max(1, (os.cpu_count() or 2) // 2)))
+
 import sys
 import subprocess
 import threading
@@ -19,13 +23,16 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 import rumps
 from rumps import notification
+from PyObjCTools import AppHelper
 
 from src.screenshot import ScreenshotService
-from src.model_inference import ModelInferenceService
+from src.model_inference import get_model_service
 from src.tracking import TrackingService
 from src.scheduler import Scheduler
 from src.logging_service import get_logging_service
 from src.status_service import get_status_service, AppStatus
+from src.config_watcher import ConfigWatcher
+from src.workflow import WorkflowEvent, WorkflowRunner
 from config import OUTPUT_FILE
 import config
 
@@ -41,22 +48,39 @@ class ScreendescribeMenuBarApp(rumps.App):
 
         # Initialize services (using config values directly)
         self.screenshot_service = ScreenshotService()
-        self.model_service = ModelInferenceService()
+        self.model_service = get_model_service()
         # Use config for output file
         self.tracking_service = TrackingService(output_file=OUTPUT_FILE)
         self.scheduler: Optional[Scheduler] = None
+        self._scheduler_lock = threading.Lock()
+
+        # Apply config.py edits (from Preferences...) to the running services
+        self.config_watcher = ConfigWatcher()
+        self.config_watcher.on_reload(self._apply_config)
+
+        # Scheduled and manual captures share one runner: capture runs on the
+        # caller's thread, inference is batched on the runner's worker
+        self.workflow_runner = WorkflowRunner(
+            self.screenshot_service,
+            self.model_service,
+            self.tracking_service,
+            on_event=self._on_workflow_event,
+            batched=True,
+        )
 
         # Build menu
         self._build_menu()
 
-        # Set up status update timer
-        self._status_timer = rumps.Timer(
-            self._update_menu_status, 5
-        )  # Update every 5 seconds
-        self._status_timer.start()
+        # Refresh the menu and start/stop the scheduler whenever the status changes
+        self.status_service.on_change(self._schedule_menu_update)
+        self.status_service.on_change(self._reconcile_scheduler)
 
-        # Start scheduler by default
-        self.status_service.set_status(AppStatus.RUNNING)
+        # Hold the scheduler until the model is warm, then start it by default
+        self.status_service.set_status(AppStatus.LOADING)
+        self._warmup_thread = threading.Thread(
+            target=self._warmup_model, daemon=True
+        )
+        self._warmup_thread.start()
 
         # Register cleanup function to run on exit
         atexit.register(self._cleanup)
@@ -78,16 +102,22 @@ class ScreendescribeMenuBarApp(rumps.App):
             rumps.MenuItem("Preferences...", callback=self._on_preferences),
         ]
 
+    def _schedule_menu_update(self) -> None:
+        """Schedule a menu refresh on the main thread (status changes come from any thread)."""
+        AppHelper.callAfter(self._update_menu_status)
+
     def _update_menu_status(self, _=None):
         """Update menu status items."""
-        status_str = self.status_service.get_status_string()
+        snapshot = self.status_service.snapshot()
 
-        # Update status item
-        self.status_item.title = f"Status: {status_str}"
+        # Update status item (only touch the Objective-C side when it changed)
+        status_title = f"Status: {snapshot.status_string}"
+        if self.status_item.title != status_title:
+            self.status_item.title = status_title
 
         # Update last entry item
-        last_entry_preview = self.status_service.get_last_entry_preview()
-        last_entry_timestamp = self.status_service.get_last_entry_timestamp()
+        last_entry_preview = snapshot.last_entry_preview
+        last_entry_timestamp = snapshot.last_entry_timestamp
 
         if last_entry_preview and last_entry_timestamp:
             time_str = last_entry_timestamp.strftime("%H:%M")
@@ -96,55 +126,68 @@ class ScreendescribeMenuBarApp(rumps.App):
                 if len(last_entry_preview) > 50
                 else last_entry_preview
             )
-            self.last_entry_item.title = f"Last Entry ({time_str}): {preview}"
+            last_entry_title = f"Last Entry ({time_str}): {preview}"
         else:
-            self.last_entry_item.title = "Last Entry: None"
-
-    @rumps.timer(1)  # Check every second
-    def _check_scheduler(self, _):
-        """Check if scheduler needs to be started/stopped."""
-        status = self.status_service.get_status()
-        is_running = status == AppStatus.RUNNING
-
-        if is_running and not self.scheduler:
-            # Start scheduler
-            self.scheduler = Scheduler(
-                task=self._execute_workflow,
-                interval=config.SCREENSHOT_INTERVAL_SECONDS,
-            )
-            self.scheduler.start()
-            self.logger.info("Scheduler started from menu bar app")
-        elif not is_running and self.scheduler and status != AppStatus.PROCESSING:
-            # Stop scheduler (but not if currently processing)
-            self.scheduler.stop()
-            self.scheduler = None
-            self.logger.info("Scheduler stopped from menu bar app")
+            last_entry_title = "Last Entry: None"
 
-    def _execute_workflow(self) -> None:
-        """Execute the complete workflow: screenshot -> inference -> logging."""
-        self.status_service.set_status(AppStatus.PROCESSING)
-        self.status_service.set_last_execution()
+        if self.last_entry_item.title != last_entry_title:
+            self.last_entry_item.title = last_entry_title
 
+    def _warmup_model(self) -> None:
+        """Load and warm up the model in the background, then start scheduling."""
         try:
-            self.logger.info("Starting workflow execution...")
-
-            # Step 1: Capture screenshot
-            self.logger.info("Capturing screenshot...")
-            image = self.screenshot_service.capture()
-            self.logger.info("Screenshot captured successfully")
-
-            # Step 2: Run model inference
-            self.logger.info("Running model inference...")
-            description = self.model_service.describe_image(image)
-            self.logger.info(f"Inference completed: {description[:100]}...")
+            self.model_service.warmup()
+        except Exception as e:
+            # Not fatal: the first capture will retry loading and report the error
+            self.logger.warning(f"Model warmup failed: {e}")
+        finally:
+            self.status_service.set_status(AppStatus.RUNNING)
 
-            # Step 3: Log to tracking file
-            self.logger.info("Logging to tracking file...")
-            self.tracking_service.append_entry(description)
-            self.logger.info("Entry logged successfully")
+    def _reconcile_scheduler(self) -> None:
+        """Start or stop the scheduler to match the current status."""
+        with self._scheduler_lock:
+            status = self.status_service.snapshot().status
+            is_running = status == AppStatus.RUNNING
+
+            if is_running and not self.scheduler:
+                # Start scheduler
+                self.scheduler = Scheduler(
+                    task=self._execute_workflow,
+                    interval=config.SCREENSHOT_INTERVAL_SECONDS,
+                )
+                self.scheduler.start()
+                self.logger.info("Scheduler started from menu bar app")
+            elif not is_running and self.scheduler and status != AppStatus.PROCESSING:
+                # Stop scheduler (but not if currently processing)
+                self.scheduler.stop()
+                self.scheduler = None
+                self.logger.info("Scheduler stopped from menu bar app")
 
+    def _execute_workflow(self) -> None:
+        """Execute the complete workflow: screenshot -> inference -> logging."""
+        self.config_watcher.check_for_changes()
+        # Returns once the screenshot is queued; inference and logging run on
+        # the runner's worker, overlapping with the next capture
+        self.workflow_runner.submit()
+
+    def _apply_config(self) -> None:
+        """Push reloaded config values into the running services (model stays loaded)."""
+        self.model_service.prompt_text = config.PROMPT_TEXT
+        self.tracking_service.output_file = config.OUTPUT_FILE
+        with self._scheduler_lock:
+            if self.scheduler:
+                # Takes effect when the next run is scheduled
+                self.scheduler.interval = config.SCREENSHOT_INTERVAL_SECONDS
+
+    def _on_workflow_event(self, event: WorkflowEvent, detail: Optional[str]) -> None:
+        """Update status and show notifications for workflow events."""
+        if event == WorkflowEvent.STARTED:
+            self.status_service.set_status(AppStatus.PROCESSING)
+            self.status_service.set_last_execution()
+
+        elif event == WorkflowEvent.COMPLETED:
             # Update status
-            self.status_service.set_last_entry(description)
+            self.status_service.set_last_entry(detail)
             self.status_service.set_status(AppStatus.RUNNING)
             self.status_service.reset_error_count()
 
@@ -152,19 +195,10 @@ class ScreendescribeMenuBarApp(rumps.App):
             notification(
                 title="Screendescribe",
                 subtitle="Entry logged successfully",
-                message=description[:100] + "..."
-                if len(description) > 100
-                else description,
+                message=detail[:100] + "..." if len(detail) > 100 else detail,
             )
 
-            self.logger.info("Workflow completed successfully!")
-
-        except Exception as e:
-            self.logger.error(f"Error in workflow execution: {e}")
-            import traceback
-
-            self.logger.error(traceback.format_exc())
-
+        elif event == WorkflowEvent.FAILED:
             # Update status
             self.status_service.set_status(AppStatus.ERROR)
             self.status_service.increment_error_count()
@@ -173,19 +207,20 @@ class ScreendescribeMenuBarApp(rumps.App):
             notification(
                 title="Screendescribe Error",
                 subtitle="Workflow execution failed",
-                message=str(e)[:100],
+                message=detail[:100],
             )
 
     def _on_capture_now(self, _):
         """Handle manual capture trigger."""
-        if self.status_service.get_status() == AppStatus.PROCESSING:
+        if self.status_service.get_status() == AppStatus.LOADING:
             notification(
                 title="Screendescribe",
-                subtitle="Already processing",
-                message="Please wait for current capture to complete.",
+                subtitle="Model is loading",
+                message="Please wait until the model has finished loading.",
             )
             return
 
+        # A capture during processing is queued and described with the pending one
         self.logger.info("Manual capture triggered")
         # Execute in background thread
         thread = threading.Thread(target=self._execute_workflow, daemon=True)
@@ -204,11 +239,12 @@ class ScreendescribeMenuBarApp(rumps.App):
             config_path = Path(__file__).parent / "config.py"
 
             # Open config.py in TextEdit using macOS 'open' command
-            subprocess.run(
-                ["open", "-a", "TextEdit", str(config_path)],
-                check=True,
+            # (Popen so the main thread doesn't block on the launch)
+            subprocess.Popen(["open", "-a", "TextEdit", str(config_path)])
+            self.logger.info(
+                f"Opened config.py in TextEdit: {config_path} "
+                "(changes apply from the next capture)"
             )
-            self.logger.info(f"Opened config.py in TextEdit: {config_path}")
         except Exception as e:
             self.logger.error(f"Failed to open config.py in TextEdit: {e}")
             notification(
@@ -0,0 +1,70 @@
+"""Config file watcher for applying config.py edits without a restart."""
+
+import importlib
+import os
+import threading
+from typing import Callable, List, Optional
+
+import config
+from src.logging_service import get_logging_service
+
+
+class ConfigWatcher:
+    """Reloads config.py when it changes on disk and notifies listeners."""
+
+    def __init__(self, config_path: Optional[str] = None):
+        """
+        Initialize config watcher.
+
+        Args:
+            config_path: Optional path to the config file.
+                        Defaults to the loaded config module's file
+        """
+        self.config_path = config_path or config.__file__
+        self._mtime = self._get_mtime()
+        self._callbacks: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+        self.logger = get_logging_service()
+
+    def _get_mtime(self) -> Optional[float]:
+        """Get the config file modification time, or None if unavailable."""
+        try:
+            return os.stat(self.config_path).st_mtime
+        except OSError:
+            return None
+
+    def on_reload(self, callback: Callable[[], None]) -> None:
+        """
+        Register a callback invoked after config.py has been reloaded.
+
+        Args:
+            callback: Callable taking no arguments; read new values from `config`
+        """
+        self._callbacks.append(callback)
+
+    def check_for_changes(self) -> bool:
+        """
+        Reload config.py if it was modified since the last check.
+
+        A single stat() call when nothing changed, so it is cheap enough to
+        run before every capture.
+
+        Returns:
+            True if the config was reloaded, False otherwise
+        """
+        with self._lock:
+            mtime = self._get_mtime()
+            if mtime is None or mtime == self._mtime:
+                return False
+            self._mtime = mtime
+
+            try:
+                importlib.reload(config)
+            except Exception as e:
+                self.logger.error(f"Failed to reload {self.config_path}: {e}")
+                return False
+
+        self.logger.info(f"Reloaded configuration from {self.config_path}")
+        for callback in list(self._callbacks):
+            callback()
+        return True
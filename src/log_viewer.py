@@ -1,74 +1,73 @@
 """Log viewer window for menu bar app."""
 
+import heapq
+import os
+import tempfile
 import rumps
+from AppKit import NSWorkspace
 from typing import Any
 
 from src.logging_service import get_logging_service, LogLevel
 
+LOG_VIEW_FILE_NAME = "screendescribe_logs.txt"
+
+
+def _open_in_textedit(log_text: str) -> None:
+    """Write log text to a reusable temporary file and open it in TextEdit."""
+    logger = get_logging_service()
+
+    # One fixed file, overwritten on every view, instead of a new tempfile per click
+    log_path = os.path.join(tempfile.gettempdir(), LOG_VIEW_FILE_NAME)
+
+    try:
+        with open(log_path, "w", encoding="utf-8") as f:
+            f.write(log_text)
+
+        # In-process LaunchServices call instead of spawning the `open` helper
+        opened = NSWorkspace.sharedWorkspace().openFile_withApplication_(
+            log_path, "TextEdit"
+        )
+        if not opened:
+            raise RuntimeError(f"TextEdit could not open {log_path}")
+    except Exception as e:
+        logger.error(f"Failed to open log viewer: {e}")
+        # Fallback: show in alert (truncated)
+        rumps.alert(
+            "Recent Log Entries:\n\n" + log_text[-500:],
+            "Log Viewer"
+        )
+
 
 def show_log_viewer(app: Any):
     """Show log viewer window."""
     logger = get_logging_service()
 
-    # Get recent log entries
-    entries = logger.get_recent(100)
-    
-    if not entries:
+    # Format log entries (the buffer only holds the most recent entries)
+    log_text = logger.get_formatted_logs()
+
+    if not log_text:
         rumps.alert("No log entries available.", "Log Viewer")
         return
 
-    # Format log entries
-    log_text = "\n".join(str(entry) for entry in entries)
-
-    # Create window to display logs
-    # Note: rumps doesn't have a built-in text view, so we'll use a simple window
-    # For a better experience, you might want to use PyObjC's NSTextView
-    
     # Show logs in a window (rumps limitation: can't easily show multi-line text)
-    # We'll create a simple display
+    # The full log is only written out when the user asks for TextEdit
     response = rumps.Window(
         message="Recent Log Entries (last 100):\n\n" + log_text[-2000:],  # Limit to last 2000 chars
         default_text="",
         title="Log Viewer",
         ok="Close",
-        cancel=None,
+        cancel="Open in TextEdit",
         dimensions=(800, 600),
     ).run()
 
-    # For a better log viewer, we could:
-    # 1. Use PyObjC to create a proper NSTextView window
-    # 2. Save logs to a file and open it in TextEdit
-    # 3. Use a web view with HTML formatting
-    
-    # Alternative: Open logs in TextEdit
-    import tempfile
-    import subprocess
-    import os
-    
-    # Create temporary file with logs
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-        f.write(log_text)
-        temp_path = f.name
-    
-    try:
-        # Open in TextEdit
-        subprocess.run(['open', '-a', 'TextEdit', temp_path], check=False)
-    except Exception as e:
-        logger.error(f"Failed to open log viewer: {e}")
-        # Fallback: show in alert (truncated)
-        rumps.alert(
-            "Recent Log Entries:\n\n" + log_text[-500:],
-            "Log Viewer"
-        )
+    if response.clicked == 0:  # Open in TextEdit
+        _open_in_textedit(log_text)
 
 
 def show_log_viewer_advanced(app: Any):
     """Show advanced log viewer with filtering."""
     logger = get_logging_service()
 
-    # Get all entries
-    all_entries = logger.get_recent(100)
-    
     # Filter options
     response = rumps.alert(
         "Log Viewer Options",
@@ -80,13 +79,16 @@ def show_log_viewer_advanced(app: Any):
     )
 
     if response == 1:  # All
-        entries = all_entries
+        entries = logger.get_recent(100)
     elif response == 2:  # Errors Only
         entries = logger.get_entries(level=LogLevel.ERROR)
     elif response == 3:  # Warnings and Errors
         error_entries = logger.get_entries(level=LogLevel.ERROR)
         warning_entries = logger.get_entries(level=LogLevel.WARNING)
-        entries = sorted(error_entries + warning_entries, key=lambda e: e.timestamp)
+        # Both lists are already chronological, so merge instead of re-sorting
+        entries = list(
+            heapq.merge(error_entries, warning_entries, key=lambda e: e.created)
+        )
     else:
         return
 
@@ -95,18 +97,5 @@ def show_log_viewer_advanced(app: Any):
         return
 
     # Format and display
-    log_text = "\n".join(str(entry) for entry in entries)
-    
-    # Open in TextEdit
-    import tempfile
-    import subprocess
-    
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-        f.write(log_text)
-        temp_path = f.name
-    
-    try:
-        subprocess.run(['open', '-a', 'TextEdit', temp_path], check=False)
-    except Exception as e:
-        logger.error(f"Failed to open log viewer: {e}")
-
+    log_text = "\n".join(map(str, entries))
+    _open_in_textedit(log_text)
@@ -2,8 +2,12 @@
 
 import logging
 import sys
+import threading
+import time
+from collections import deque
 from datetime import datetime
-from typing import List, Optional, Tuple
+from itertools import islice
+from typing import Deque, Dict, List, Optional, Tuple
 from enum import Enum
 
 
@@ -16,11 +20,25 @@ class LogLevel(Enum):
     ERROR = "ERROR"
 
 
+# Python logging level for each LogLevel
+_PY_LEVEL = {
+    LogLevel.DEBUG: logging.DEBUG,
+    LogLevel.INFO: logging.INFO,
+    LogLevel.WARNING: logging.WARNING,
+    LogLevel.ERROR: logging.ERROR,
+}
+
+
 class LogEntry:
     """Represents a single log entry."""
 
     def __init__(
-        self, level: LogLevel, message: str, timestamp: Optional[datetime] = None
+        self,
+        level: LogLevel,
+        message: str,
+        timestamp: Optional[datetime] = None,
+        created: Optional[float] = None,
+        line_cache: Optional[List[Optional[str]]] = None,
     ):
         """
         Initialize log entry.
@@ -29,15 +47,34 @@ class LogEntry:
             level: Log level
             message: Log message
             timestamp: Optional timestamp (defaults to now)
+            created: Optional timestamp as epoch seconds (takes precedence over timestamp)
+            line_cache: Optional one-item list holding the formatted line, shared
+                        by every LogEntry built for the same log buffer row
         """
         self.level = level
         self.message = message
-        self.timestamp = timestamp or datetime.now()
+        # Epoch seconds; the datetime is only built when someone asks for it
+        if created is not None:
+            self.created = created
+        else:
+            self.created = timestamp.timestamp() if timestamp else time.time()
+        self._line = line_cache if line_cache is not None else [None]
+
+    @property
+    def timestamp(self) -> datetime:
+        """Entry timestamp as a local datetime."""
+        return datetime.fromtimestamp(self.created)
 
     def __str__(self) -> str:
         """Format log entry as string."""
-        time_str = self.timestamp.strftime("%Y-%m-%d %H:%M:%S")
-        return f"[{time_str}] [{self.level.value}] {self.message}"
+        # Entries are immutable, so format once instead of on every viewer refresh;
+        # the cache is stored with the buffer row, so later reads reuse it
+        line = self._line[0]
+        if line is None:
+            time_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.created))
+            line = f"[{time_str}] [{self.level.value}] {self.message}"
+            self._line[0] = line
+        return line
 
     def to_dict(self) -> dict:
         """Convert log entry to dictionary."""
@@ -48,6 +85,77 @@ class LogEntry:
         }
 
 
+class _LogColumns:
+    """Bounded log buffer stored column-wise (parallel deques, one per field)."""
+
+    __slots__ = ("created", "levels", "messages", "lines", "level")
+
+    def __init__(self, max_entries: int, level: Optional[LogLevel] = None):
+        """
+        Initialize columns.
+
+        Args:
+            max_entries: Maximum number of entries to keep
+            level: Level shared by every entry, for a single-level buffer.
+                   If given, no per-entry level column is stored
+        """
+        self.created: Deque[float] = deque(maxlen=max_entries)
+        self.levels: Optional[Deque[LogLevel]] = (
+            deque(maxlen=max_entries) if level is None else None
+        )
+        self.messages: Deque[str] = deque(maxlen=max_entries)
+        # Formatted-line cells, filled in the first time an entry is formatted
+        self.lines: Deque[List[Optional[str]]] = deque(maxlen=max_entries)
+        self.level = level
+
+    def append(
+        self,
+        created: float,
+        level: LogLevel,
+        message: str,
+        line: List[Optional[str]],
+    ) -> None:
+        """Append one entry; the oldest is evicted once full."""
+        self.created.append(created)
+        if self.levels is not None:
+            self.levels.append(level)
+        self.messages.append(message)
+        self.lines.append(line)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self.created.clear()
+        if self.levels is not None:
+            self.levels.clear()
+        self.messages.clear()
+        self.lines.clear()
+
+    def to_entries(self, limit: Optional[int] = None) -> List[LogEntry]:
+        """
+        Materialize the newest entries as LogEntry objects.
+
+        Args:
+            limit: Optional number of most recent entries to return
+
+        Returns:
+            List of log entries, oldest first
+        """
+        start = max(0, len(self.messages) - limit) if limit else 0
+        if self.levels is None:
+            rows = islice(zip(self.created, self.messages, self.lines), start, None)
+            return [
+                LogEntry(self.level, message, created=created, line_cache=line)
+                for created, message, line in rows
+            ]
+        rows = islice(
+            zip(self.created, self.levels, self.messages, self.lines), start, None
+        )
+        return [
+            LogEntry(level, message, created=created, line_cache=line)
+            for created, level, message, line in rows
+        ]
+
+
 class LoggingService:
     """Service for UI-friendly logging with in-memory storage."""
 
@@ -59,55 +167,76 @@ class LoggingService:
             max_entries: Maximum number of log entries to keep in memory
         """
         self.max_entries = max_entries
-        self._entries: List[LogEntry] = []
-        self._lock = False  # Simple lock for thread safety (can be enhanced with threading.Lock if needed)
-        self._logging_directly = False  # Flag to prevent recursion
+        # Bounded ring buffer: appending past max_entries evicts the oldest in O(1).
+        # Stored as columns; LogEntry objects are only built when entries are read
+        self._entries = _LogColumns(max_entries)
+        # Per-level index so level-filtered reads don't scan every entry
+        self._by_level: Dict[LogLevel, _LogColumns] = {
+            lvl: _LogColumns(max_entries, level=lvl) for lvl in LogLevel
+        }
+        # Guards the buffers against concurrent scheduler, timer and capture threads
+        self._lock = threading.RLock()
+        # Per-thread flag to prevent recursion
+        self._local = threading.local()
 
         # Set up Python logging for console output only (not forwarding back to service)
         self._logger = logging.getLogger("screendescribe")
-        self._logger.setLevel(logging.DEBUG)
+        # Match the console handler level so isEnabledFor() filters DEBUG early
+        self._logger.setLevel(logging.INFO)
         # Prevent propagation to root logger to avoid duplicate messages
         self._logger.propagate = False
 
         # Only log to console, don't create circular handler
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(logging.INFO)
-        console_formatter = logging.Formatter("[%(levelname)s] %(message)s")
+        console_formatter = logging.Formatter(
+            "[%(levelname)s] %(message)s", validate=False
+        )
         console_handler.setFormatter(console_formatter)
         self._logger.addHandler(console_handler)
 
-    def log(self, level: LogLevel, message: str) -> None:
+    def log(self, level: LogLevel, message: str, exc_info: bool = False) -> None:
         """
         Log a message.
 
         Args:
             level: Log level
             message: Log message
+            exc_info: If True, attach the current exception to the console record
         """
         # Prevent recursion
-        if self._logging_directly:
+        if getattr(self._local, "logging_directly", False):
             return
 
-        entry = LogEntry(level, message)
-        self._entries.append(entry)
-
-        # Keep only the most recent entries
-        if len(self._entries) > self.max_entries:
-            self._entries.pop(0)
+        created = time.time()
+        # One cell shared by both buffers, so a line formatted via either is reused
+        line: List[Optional[str]] = [None]
+        with self._lock:
+            self._entries.append(created, level, message, line)
+            self._by_level[level].append(created, level, message, line)
 
         # Also log via Python logging for console output (but prevent recursion)
-        self._logging_directly = True
+        self._local.logging_directly = True
         try:
-            if level == LogLevel.DEBUG:
-                self._logger.debug(message)
-            elif level == LogLevel.INFO:
-                self._logger.info(message)
-            elif level == LogLevel.WARNING:
-                self._logger.warning(message)
-            elif level == LogLevel.ERROR:
-                self._logger.error(message)
+            # Skip LogRecord creation for levels no handler will emit
+            py_level = _PY_LEVEL[level]
+            if self._logger.isEnabledFor(py_level):
+                # Hand over a pre-built record: skips Logger._log's findCaller()
+                # stack walk and stamps it with the entry's own time
+                record = self._logger.makeRecord(
+                    self._logger.name,
+                    py_level,
+                    "(unknown file)",
+                    0,
+                    message,
+                    None,
+                    sys.exc_info() if exc_info else None,
+                )
+                record.created = created
+                record.msecs = float(int(created * 1000) % 1000)
+                self._logger.handle(record)
         finally:
-            self._logging_directly = False
+            self._local.logging_directly = False
 
     def debug(self, message: str) -> None:
         """Log debug message."""
@@ -125,6 +254,15 @@ class LoggingService:
         """Log error message."""
         self.log(LogLevel.ERROR, message)
 
+    def exception(self, message: str) -> None:
+        """
+        Log error message with the current exception's traceback.
+
+        The traceback is formatted lazily by the console handler, only if the
+        record is emitted; the in-memory entry keeps just the message.
+        """
+        self.log(LogLevel.ERROR, message, exc_info=True)
+
     def get_entries(
         self,
         level: Optional[LogLevel] = None,
@@ -140,17 +278,10 @@ class LoggingService:
         Returns:
             List of log entries
         """
-        entries = self._entries
-
-        # Filter by level if specified
-        if level:
-            entries = [e for e in entries if e.level == level]
-
-        # Apply limit if specified
-        if limit:
-            entries = entries[-limit:]
-
-        return entries
+        with self._lock:
+            # Filter by level if specified, apply limit before materializing
+            columns = self._by_level[level] if level else self._entries
+            return columns.to_entries(limit)
 
     def get_recent(self, count: int = 100) -> List[LogEntry]:
         """
@@ -175,11 +306,14 @@ class LoggingService:
             Formatted log string
         """
         entries = self.get_entries(level=level)
-        return "\n".join(str(entry) for entry in entries)
+        return "\n".join(map(str, entries))
 
     def clear(self) -> None:
         """Clear all log entries."""
-        self._entries.clear()
+        with self._lock:
+            self._entries.clear()
+            for level_columns in self._by_level.values():
+                level_columns.clear()
 
     def get_logger(self) -> logging.Logger:
         """
@@ -1,21 +1,62 @@
 """MLX model inference module for vision-language models."""
 
+import functools
+import importlib.util
+import json
 import os
-from typing import Optional
+import queue
+import re
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 from PIL import Image
 
 from config import (
+    HF_DOWNLOAD_ALLOW_PATTERNS,
+    FREQUENCY_PENALTY,
+    HF_DOWNLOAD_MAX_WORKERS,
+    MAX_TOKENS,
     MODEL_NAME,
     MODEL_PATH,
     PROMPT_TEXT,
+    TEMPERATURE,
 )
 from src.logging_service import get_logging_service
 
+# Use the Rust-accelerated transfer backend when installed (pip install hf_transfer).
+# huggingface_hub reads this once when first imported, and mlx-vlm imports it,
+# so it must be set before the mlx-vlm import below.
+if HF_DOWNLOAD_MAX_WORKERS > 1 and importlib.util.find_spec("hf_transfer"):
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
 
+# Bind mlx-vlm entry points once; a missing install is reported when loading
+try:
+    from mlx_vlm import generate as _mlx_generate, load as _mlx_load
+    from mlx_vlm.prompt_utils import apply_chat_template as _apply_chat_template
+    from mlx_vlm.utils import load_config as _load_config
+
+    _MLX_VLM_IMPORT_ERROR: Optional[ImportError] = None
+except ImportError as e:
+    _MLX_VLM_IMPORT_ERROR = e
+
+try:
+    import mlx.core as mx
+except ImportError:
+    mx = None
+
+# Line the model is asked to put between descriptions in a batched prompt
+BATCH_SEPARATOR = "---"
+
+# Read size used when prewarming weight files without posix_fadvise
+PREWARM_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+@functools.lru_cache(maxsize=1)
 def find_model_path() -> str:
     """
     Find the model path by checking LM Studio location first, then project location.
     Returns the path where the model exists or should be downloaded.
+    The result is cached until a model download clears it.
 
     Returns:
         Path to the model directory
@@ -27,15 +68,13 @@ def find_model_path() -> str:
 
     logger = get_logging_service()
 
-    # Check LM Studio location first
-    lmstudio_config_path = os.path.join(lmstudio_path, "config.json")
-    if os.path.exists(lmstudio_config_path):
+    # Check LM Studio location first (is_file() is a single stat call)
+    if Path(lmstudio_path, "config.json").is_file():
         logger.info(f"Found model at LM Studio location: {lmstudio_path}")
         return lmstudio_path
 
     # Check project path
-    project_config_path = os.path.join(project_path, "config.json")
-    if os.path.exists(project_config_path):
+    if Path(project_path, "config.json").is_file():
         logger.info(f"Found model at project location: {project_path}")
         return project_path
 
@@ -71,12 +110,17 @@ def download_model_from_huggingface(repo_id: str, local_dir: str) -> None:
         os.makedirs(os.path.dirname(local_dir), exist_ok=True)
 
         # Download the model
+        # Fetch files concurrently instead of one request at a time
         snapshot_download(
             repo_id=repo_id,
             local_dir=local_dir,
             local_dir_use_symlinks=False,
+            allow_patterns=HF_DOWNLOAD_ALLOW_PATTERNS,
+            max_workers=HF_DOWNLOAD_MAX_WORKERS,
         )
         logger.info(f"Model downloaded successfully to {local_dir}")
+        # The model may now exist where the cached probe found nothing
+        find_model_path.cache_clear()
     except Exception as e:
         raise RuntimeError(
             f"Failed to download model from Hugging Face: {e}\n"
@@ -85,6 +129,120 @@ def download_model_from_huggingface(repo_id: str, local_dir: str) -> None:
         ) from e
 
 
+def _is_valid_safetensors(path: Path) -> bool:
+    """
+    Check that a safetensors file has a readable header and is not truncated.
+
+    Args:
+        path: Path to the .safetensors file
+
+    Returns:
+        True if the header parses and the file size matches the declared data
+    """
+    try:
+        size = path.stat().st_size
+        with open(path, "rb") as f:
+            # Layout: 8-byte little-endian header length, JSON header, tensor data
+            header_len = int.from_bytes(f.read(8), "little")
+            if header_len <= 0 or 8 + header_len > size:
+                return False
+            header = json.loads(f.read(header_len))
+
+        data_end = max(
+            (
+                tensor["data_offsets"][1]
+                for name, tensor in header.items()
+                if name != "__metadata__"
+            ),
+            default=0,
+        )
+    except (OSError, ValueError, KeyError, TypeError, IndexError):
+        return False
+
+    return 8 + header_len + data_end == size
+
+
+def remove_invalid_safetensors(model_dir: str) -> List[str]:
+    """
+    Delete truncated or corrupted safetensors shards from a model directory.
+
+    Args:
+        model_dir: Local model directory
+
+    Returns:
+        File names of the removed shards
+    """
+    removed = []
+    for shard in sorted(Path(model_dir).glob("*.safetensors")):
+        if not _is_valid_safetensors(shard):
+            shard.unlink()
+            removed.append(shard.name)
+    return removed
+
+
+def _clear_mlx_cache() -> None:
+    """Return MLX's cached device buffers to the system, if supported."""
+    if mx is None:
+        return
+    try:
+        mx.clear_cache()
+    except AttributeError:
+        # Older mlx releases only expose it under mx.metal
+        try:
+            mx.metal.clear_cache()
+        except AttributeError:
+            pass
+
+
+def _prewarm_file(path: Path) -> None:
+    """Pull one file into the page cache, ignoring errors."""
+    try:
+        if hasattr(os, "posix_fadvise"):
+            # Kernel readahead in the background; returns immediately
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            finally:
+                os.close(fd)
+        else:
+            # macOS has no posix_fadvise: read the file and discard the data
+            buffer = bytearray(PREWARM_CHUNK_SIZE)
+            with open(path, "rb", buffering=0) as f:
+                while f.readinto(buffer):
+                    pass
+    except OSError:
+        pass
+
+
+def prewarm_safetensors(model_dir: str, max_workers: int = 4) -> None:
+    """
+    Start reading a model's safetensors shards into the page cache.
+
+    Returns immediately; the reads run on daemon threads so disk I/O
+    overlaps with the rest of model loading and never delays exit.
+
+    Args:
+        model_dir: Local model directory
+        max_workers: Maximum number of shards read concurrently
+    """
+    shards: queue.SimpleQueue = queue.SimpleQueue()
+    count = 0
+    for shard in Path(model_dir).glob("*.safetensors"):
+        shards.put(shard)
+        count += 1
+
+    def worker() -> None:
+        while True:
+            try:
+                shard = shards.get_nowait()
+            except queue.Empty:
+                return
+            _prewarm_file(shard)
+
+    for _ in range(min(max_workers, count)):
+        threading.Thread(target=worker, daemon=True).start()
+
+
 class ModelInferenceService:
     """Service for running vision-language model inference using MLX."""
 
@@ -102,37 +260,56 @@ class ModelInferenceService:
         else:
             # Auto-detect model path (checks old location first)
             self.model_path = find_model_path()
+        self.prompt_text = PROMPT_TEXT
         self.model = None
         self.processor = None
+        # Model config and chat-templated prompts are invariant once loaded
+        self._config = None
+        self._formatted_prompt_cache: Dict[Tuple[str, int], str] = {}
         self._loaded = False
+        self._load_lock = threading.Lock()
         self.logger = get_logging_service()
 
     def _load_model(self):
         """Load the MLX model and processor."""
+        # Serialize loading so a warmup thread and a capture never load twice
+        with self._load_lock:
+            self._load_model_locked()
+
+    def _load_model_locked(self):
+        """Load the MLX model and processor (caller must hold _load_lock)."""
         if self._loaded:
             return
 
+        if _MLX_VLM_IMPORT_ERROR is not None:
+            raise RuntimeError(
+                f"mlx-vlm could not be imported: {_MLX_VLM_IMPORT_ERROR}\n"
+                "Please install the dependencies: pip install -r requirements.txt"
+            ) from _MLX_VLM_IMPORT_ERROR
+
         # Check for config.json (required by mlx-vlm) - if not found, download the model
-        config_path = os.path.join(self.model_path, "config.json")
-        if not os.path.exists(config_path):
+        config_path = Path(self.model_path, "config.json")
+        if not config_path.is_file():
             # Model doesn't exist or is incomplete, download it
             download_model_from_huggingface(
                 repo_id=MODEL_NAME,
                 local_dir=self.model_path,
             )
             # Verify download was successful
-            if not os.path.exists(config_path):
+            if not config_path.is_file():
                 raise RuntimeError(
                     f"Model download completed but config.json not found at {config_path}\n"
                     "The downloaded model may be incomplete or corrupted."
                 )
 
+        # Start paging weights in from disk while mlx-vlm sets up the model
+        prewarm_safetensors(self.model_path)
+
         try:
             # Use mlx_vlm.load() function (standard API)
-            from mlx_vlm import load
-
             self.logger.info(f"Loading model from {self.model_path}...")
-            self.model, self.processor = load(self.model_path)
+            self.model, self.processor = _mlx_load(self.model_path)
+            self._config = _load_config(self.model_path)
             self._loaded = True
             self.logger.info(f"Model loaded successfully from {self.model_path}")
             return
@@ -147,26 +324,25 @@ class ModelInferenceService:
             ):
                 self.logger.warning(
                     f"Safetensors error detected: {error_msg}. "
-                    "Attempting to re-download the model..."
+                    "Attempting to re-download the missing or corrupted files..."
                 )
                 try:
-                    import shutil
-
-                    # Remove the incomplete/corrupted model directory
-                    if os.path.exists(self.model_path):
-                        shutil.rmtree(self.model_path)
+                    # Remove only the broken shards instead of the whole model directory
+                    removed = remove_invalid_safetensors(self.model_path)
+                    if removed:
                         self.logger.info(
-                            f"Removed incomplete model at {self.model_path}"
+                            f"Removed invalid model shards: {', '.join(removed)}"
                         )
 
-                    # Re-download the model
+                    # Re-download the model (complete files are kept, so only
+                    # missing/removed files are fetched)
                     download_model_from_huggingface(
                         repo_id=MODEL_NAME,
                         local_dir=self.model_path,
                     )
 
                     # Verify download was successful
-                    if not os.path.exists(config_path):
+                    if not config_path.is_file():
                         raise RuntimeError(
                             f"Model re-download completed but config.json not found at {config_path}\n"
                             "The downloaded model may be incomplete or corrupted."
@@ -174,9 +350,8 @@ class ModelInferenceService:
 
                     # Try loading again after re-download
                     self.logger.info(f"Re-loading model from {self.model_path}...")
-                    from mlx_vlm import load
-
-                    self.model, self.processor = load(self.model_path)
+                    self.model, self.processor = _mlx_load(self.model_path)
+                    self._config = _load_config(self.model_path)
                     self._loaded = True
                     self.logger.info(
                         f"Model loaded successfully after re-download from {self.model_path}"
@@ -219,13 +394,39 @@ class ModelInferenceService:
                     "4. All dependencies are installed (pip install -r requirements.txt)"
                 ) from e
 
-    def describe_image(self, image: Image.Image, prompt: Optional[str] = None) -> str:
+    def _format_prompt(self, prompt_text: str, num_images: int = 1) -> str:
+        """
+        Apply the chat template to a prompt, once per distinct prompt and image count.
+
+        Args:
+            prompt_text: Prompt text
+            num_images: Number of image slots in the prompt
+
+        Returns:
+            Formatted prompt
+        """
+        key = (prompt_text, num_images)
+        formatted_prompt = self._formatted_prompt_cache.get(key)
+        if formatted_prompt is None:
+            formatted_prompt = _apply_chat_template(
+                self.processor, self._config, prompt_text, num_images=num_images
+            )
+            self._formatted_prompt_cache[key] = formatted_prompt
+        return formatted_prompt
+
+    def describe_image(
+        self,
+        image: Image.Image,
+        prompt: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+    ) -> str:
         """
         Generate description for an image using the vision-language model.
 
         Args:
             image: PIL Image object
-            prompt: Optional custom prompt. Defaults to config.PROMPT_TEXT
+            prompt: Optional custom prompt. Defaults to self.prompt_text (config.PROMPT_TEXT)
+            max_tokens: Optional cap on generated tokens. Defaults to config.MAX_TOKENS
 
         Returns:
             Generated description text
@@ -236,45 +437,156 @@ class ModelInferenceService:
         if not self._loaded:
             self._load_model()
 
-        prompt_text = prompt or PROMPT_TEXT
+        prompt_text = prompt or self.prompt_text
 
         try:
-            # Use mlx_vlm.generate() function with proper API
-            from mlx_vlm import generate
-            from mlx_vlm.prompt_utils import apply_chat_template
-            from mlx_vlm.utils import load_config
-
-            # Load config for chat template
-            config = load_config(self.model_path)
-
             # Format prompt using chat template
             # Note: mlx-vlm expects images as file paths or PIL Images
-            formatted_prompt = apply_chat_template(
-                self.processor, config, prompt_text, num_images=1
-            )
+            formatted_prompt = self._format_prompt(prompt_text)
+
+            generate_kwargs = {}
+            if max_tokens is not None:
+                generate_kwargs["max_tokens"] = max_tokens
+
+            return self._generate(formatted_prompt, [image], **generate_kwargs)
+
+        except Exception as e:
+            raise RuntimeError(f"Error during inference: {e}") from e
+
+    def _generate(self, formatted_prompt: str, images: List[Image.Image], **kwargs) -> str:
+        """
+        Run mlx_vlm.generate() and return the generated text.
+
+        Args:
+            formatted_prompt: Chat-templated prompt with one image slot per image
+            images: PIL Image objects
+            **kwargs: Generation arguments overriding the config defaults
 
-            # Generate output
-            # mlx_vlm.generate signature: generate(model, processor, formatted_prompt, image, verbose=False)
-            # Returns a GenerationResult object
-            result = generate(
+        Returns:
+            Generated text
+        """
+        # Budget MAX_TOKENS per image; greedy decoding when TEMPERATURE is 0
+        generate_kwargs = {
+            "max_tokens": MAX_TOKENS * len(images),
+            "temperature": TEMPERATURE,
+            "repetition_penalty": FREQUENCY_PENALTY,
+        }
+        generate_kwargs.update(kwargs)
+
+        # Generate output
+        # mlx_vlm.generate signature: generate(model, processor, formatted_prompt, image, verbose=False)
+        # Returns a GenerationResult object
+        try:
+            result = _mlx_generate(
                 self.model,
                 self.processor,
                 formatted_prompt,
-                [image],  # images should be a list
+                images,  # images should be a list
                 verbose=False,
+                **generate_kwargs,
             )
+        finally:
+            # Free buffers left over from this call so memory doesn't creep up
+            # across captures in a long-running session
+            _clear_mlx_cache()
+
+        # Extract text from GenerationResult object
+        # GenerationResult typically has a 'text' or 'generated_text' attribute
+        if hasattr(result, "text"):
+            return result.text
+        elif hasattr(result, "generated_text"):
+            return result.generated_text
+        elif hasattr(result, "__str__"):
+            return str(result)
+        else:
+            # Fallback: try to convert to string
+            return str(result)
 
-            # Extract text from GenerationResult object
-            # GenerationResult typically has a 'text' or 'generated_text' attribute
-            if hasattr(result, "text"):
-                return result.text
-            elif hasattr(result, "generated_text"):
-                return result.generated_text
-            elif hasattr(result, "__str__"):
-                return str(result)
-            else:
-                # Fallback: try to convert to string
-                return str(result)
+    def describe_images(
+        self, images: List[Image.Image], prompt: Optional[str] = None
+    ) -> List[str]:
+        """
+        Generate descriptions for several images in one forward pass.
+
+        All images go into a single prompt, so the vision encoder and weight
+        loads are shared across them. The model is asked to separate its
+        descriptions with BATCH_SEPARATOR; if the output can't be split into
+        one description per image, the images are described one at a time.
+
+        Args:
+            images: PIL Image objects
+            prompt: Optional custom prompt. Defaults to self.prompt_text (config.PROMPT_TEXT)
+
+        Returns:
+            Generated description text for each image, in order
+
+        Raises:
+            RuntimeError: If model loading or inference fails
+        """
+        if not self._loaded:
+            self._load_model()
+
+        if len(images) == 1:
+            return [self.describe_image(images[0], prompt)]
+
+        prompt_text = prompt or self.prompt_text
+        batch_prompt = (
+            f"{prompt_text}\n\n"
+            f"You are given {len(images)} screenshots. Describe each one "
+            f"separately, in order, and put a line containing only "
+            f"{BATCH_SEPARATOR} between the descriptions."
+        )
 
+        try:
+            formatted_prompt = self._format_prompt(batch_prompt, len(images))
+            text = self._generate(formatted_prompt, images)
         except Exception as e:
             raise RuntimeError(f"Error during inference: {e}") from e
+
+        descriptions = [
+            part.strip()
+            for part in re.split(
+                rf"^\s*{re.escape(BATCH_SEPARATOR)}\s*$", text, flags=re.MULTILINE
+            )
+            if part.strip()
+        ]
+        if len(descriptions) == len(images):
+            return descriptions
+
+        self.logger.warning(
+            f"Batched inference returned {len(descriptions)} descriptions "
+            f"for {len(images)} images, describing them one at a time"
+        )
+        return [self.describe_image(image, prompt) for image in images]
+
+    def warmup(self) -> None:
+        """
+        Load the model and run a minimal 1-token inference.
+
+        Makes weights resident and compiles the MLX graph so the first real
+        capture runs at steady-state latency.
+
+        Raises:
+            RuntimeError: If model loading or inference fails
+        """
+        self.logger.info("Warming up model...")
+        blank_image = Image.new("RGB", (64, 64), color="white")
+        self.describe_image(blank_image, max_tokens=1)
+        self.logger.info("Model warmup completed")
+
+
+# Global instance
+_model_service: Optional[ModelInferenceService] = None
+
+
+def get_model_service() -> ModelInferenceService:
+    """
+    Get global model inference service instance.
+
+    Returns:
+        ModelInferenceService instance
+    """
+    global _model_service
+    if _model_service is None:
+        _model_service = ModelInferenceService()
+    return _model_service
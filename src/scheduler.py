@@ -4,7 +4,7 @@ import threading
 import time
 from typing import Callable, Optional
 
-from config import SCREENSHOT_INTERVAL_SECONDS
+from config import SCREENSHOT_INTERVAL_SECONDS, SCREENSHOT_PRECAPTURE_DELAY_SECONDS
 from src.logging_service import get_logging_service
 
 
@@ -15,6 +15,7 @@ class Scheduler:
         self,
         task: Callable[[], None],
         interval: Optional[int] = None,
+        pre_task_delay: Optional[float] = None,
     ):
         """
         Initialize scheduler.
@@ -22,10 +23,18 @@ class Scheduler:
         Args:
             task: Callable to execute periodically (should be async-safe)
             interval: Interval in seconds. Defaults to config.SCREENSHOT_INTERVAL_SECONDS
+            pre_task_delay: Seconds to wait before each scheduled run.
+                           Defaults to config.SCREENSHOT_PRECAPTURE_DELAY_SECONDS
         """
         self.task = task
         self.interval = interval or SCREENSHOT_INTERVAL_SECONDS
-        self._timer: Optional[threading.Timer] = None
+        self.pre_task_delay = (
+            SCREENSHOT_PRECAPTURE_DELAY_SECONDS
+            if pre_task_delay is None
+            else pre_task_delay
+        )
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
         self._running = False
         self._lock = threading.Lock()
         self._is_processing = False
@@ -39,8 +48,13 @@ class Scheduler:
                 return
 
             self._running = True
+            # One long-lived thread sleeping on an event, rather than a Timer per tick
+            self._stop_event = threading.Event()
+            self._thread = threading.Thread(
+                target=self._run_loop, args=(self._stop_event,), daemon=True
+            )
+            self._thread.start()
             self.logger.info(f"Scheduler started with {self.interval}s interval")
-            self._schedule_next()
 
     def stop(self) -> None:
         """Stop the scheduler."""
@@ -49,26 +63,28 @@ class Scheduler:
                 return
 
             self._running = False
-            if self._timer:
-                self._timer.cancel()
-                self._timer = None
+            # Wakes the loop immediately instead of waiting out the interval
+            self._stop_event.set()
+            thread = self._thread
+            self._thread = None
             self.logger.info("Scheduler stopped")
 
-    def _schedule_next(self) -> None:
-        """Schedule the next execution."""
-        if not self._running:
-            return
+        # The task itself may stop the scheduler (e.g. via a status change)
+        if thread and thread is not threading.current_thread():
+            thread.join(timeout=1.0)
 
-        self._timer = threading.Timer(self.interval, self._execute)
-        self._timer.daemon = True
-        self._timer.start()
+    def _run_loop(self, stop_event: threading.Event) -> None:
+        """Run the task every interval until the stop event is set."""
+        while not stop_event.wait(self.interval):
+            if self.pre_task_delay > 0 and stop_event.wait(self.pre_task_delay):
+                return
+            self._execute_once()
 
-    def _execute(self) -> None:
-        """Execute the task and schedule the next one."""
-        # Prevent concurrent executions
+    def _execute_once(self) -> None:
+        """Execute the task once."""
+        # Prevent concurrent executions (trigger_now may race the loop)
         if self._is_processing:
             self.logger.warning("Task already in progress, skipping this execution")
-            self._schedule_next()
             return
 
         self._is_processing = True
@@ -82,9 +98,6 @@ class Scheduler:
             self.logger.error(f"Error in scheduled task: {e}")
         finally:
             self._is_processing = False
-            # Schedule next execution
-            if self._running:
-                self._schedule_next()
 
     def trigger_now(self) -> None:
         """Manually trigger the task immediately (for testing)."""
@@ -93,7 +106,7 @@ class Scheduler:
             return
 
         self.logger.info("Manually triggering task")
-        self._execute()
+        self._execute_once()
 
     def is_running(self) -> bool:
         """Check if scheduler is running."""
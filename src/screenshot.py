@@ -1,84 +1,160 @@
 """Screenshot capture module using macOS screencapture command."""
 
+import io
 import os
 import subprocess
-import time
+import tempfile
 from PIL import Image
-from typing import Optional
-
-from config import SCREENSHOT_TEMP_FILE
+from typing import Optional, Tuple
+
+from config import (
+    SCREENSHOT_CAPTURE_TIMEOUT_SECONDS,
+    SCREENSHOT_MAX_DIMENSION,
+    SCREENSHOT_PATCH_SIZE,
+    SCREENSHOT_TEMP_FILE,
+)
 from src.logging_service import get_logging_service
 
 
 class ScreenshotService:
     """Service for capturing screenshots on macOS."""
 
-    def __init__(self, temp_file: Optional[str] = None):
+    def __init__(
+        self, temp_file: Optional[str] = None, max_dimension: Optional[int] = None
+    ):
         """
         Initialize screenshot service.
 
         Args:
-            temp_file: Optional path for temporary screenshot file.
-                      Defaults to config.SCREENSHOT_TEMP_FILE
+            temp_file: Optional path for temporary screenshot file. Each capture
+                      writes a uniquely named file next to it, so concurrent
+                      captures don't collide. Defaults to config.SCREENSHOT_TEMP_FILE
+            max_dimension: Optional maximum long-edge size in pixels (0 disables).
+                          Defaults to config.SCREENSHOT_MAX_DIMENSION
         """
         self.temp_file = temp_file or SCREENSHOT_TEMP_FILE
+        self.max_dimension = (
+            SCREENSHOT_MAX_DIMENSION if max_dimension is None else max_dimension
+        )
         self.logger = get_logging_service()
 
+    def _target_size(self, size: Tuple[int, int]) -> Tuple[int, int]:
+        """
+        Compute the size that fits max_dimension, snapped to the patch grid.
+
+        Vision token count scales with image area, so this is the main lever
+        on inference time. Images are never upscaled.
+
+        Args:
+            size: Original (width, height)
+
+        Returns:
+            Target (width, height); equal to size if no resize is needed
+        """
+        if not self.max_dimension:
+            return size
+
+        width, height = size
+        scale = min(1.0, self.max_dimension / max(width, height))
+        patch = SCREENSHOT_PATCH_SIZE
+        return (
+            max(patch, int(width * scale) // patch * patch),
+            max(patch, int(height * scale) // patch * patch),
+        )
+
     def capture(self) -> Image.Image:
         """
         Capture a screenshot and return as PIL Image.
 
         Returns:
-            PIL Image object
+            PIL Image object, downscaled to fit max_dimension
 
         Raises:
             RuntimeError: If screenshot capture fails
             FileNotFoundError: If screenshot file was not created
         """
+        # Scheduled and manual captures may overlap, so each gets its own file
+        temp_file = self._create_temp_file()
         try:
-            # Wait 3 seconds before capturing to allow UI to stabilize
-            time.sleep(3)
-            
             # Use screencapture command (native macOS tool)
-            # -x flag prevents the sound effect
-            result = subprocess.run(
-                ["screencapture", "-x", self.temp_file],
-                capture_output=True,
+            # -x flag prevents the sound effect; -t jpg decodes ~4x faster than PNG
+            process = subprocess.Popen(
+                ["screencapture", "-x", "-t", "jpg", temp_file],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 text=True,
-                check=False,
             )
 
-            if result.returncode != 0:
+            # Register PIL's decoders while screencapture grabs the screen
+            Image.init()
+
+            try:
+                _, stderr = process.communicate(
+                    timeout=SCREENSHOT_CAPTURE_TIMEOUT_SECONDS
+                )
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.communicate()
+                self._remove_temp_file(temp_file)
                 raise RuntimeError(
-                    f"Failed to capture screenshot: {result.stderr}"
+                    f"Screenshot capture timed out after "
+                    f"{SCREENSHOT_CAPTURE_TIMEOUT_SECONDS}s"
                 )
 
-            # Verify file was created
-            if not os.path.exists(self.temp_file):
-                raise FileNotFoundError(
-                    f"Screenshot file was not created at {self.temp_file}"
+            if process.returncode != 0:
+                self._remove_temp_file(temp_file)
+                raise RuntimeError(
+                    f"Failed to capture screenshot: {stderr}"
                 )
 
-            # Load image with PIL
-            image = Image.open(self.temp_file)
-
-            # Clean up temporary file
+            # Read the file once and remove it right away; decoding happens in memory
             try:
-                os.remove(self.temp_file)
-            except OSError:
-                # Ignore cleanup errors
-                pass
+                with open(temp_file, "rb") as f:
+                    data = f.read()
+            except FileNotFoundError:
+                data = b""
+            finally:
+                self._remove_temp_file(temp_file)
+            # The file is pre-created empty, so no data means nothing was written
+            if not data:
+                raise FileNotFoundError(
+                    f"Screenshot file was not created at {temp_file}"
+                )
 
+            # Decode with PIL (forced now, not lazily) and downscale for the vision encoder
+            image = Image.open(io.BytesIO(data))
+            target_size = self._target_size(image.size)
+            if target_size != image.size:
+                # Let the JPEG decoder shrink by a power of two while decoding
+                # (DCT scaling), so the full-resolution bitmap is never built
+                image.draft("RGB", target_size)
+            image.load()
+
+            if image.size != target_size:
+                image = image.resize(target_size, Image.Resampling.LANCZOS)
             return image
 
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"Screenshot capture failed: {e}") from e
-        except Exception as e:
-            # Clean up on any error
-            try:
-                if os.path.exists(self.temp_file):
-                    os.remove(self.temp_file)
-            except OSError:
-                pass
-            raise
 
+    def _create_temp_file(self) -> str:
+        """
+        Create an empty, uniquely named screenshot file next to temp_file.
+
+        Returns:
+            Path of the new file
+        """
+        directory, name = os.path.split(self.temp_file)
+        stem, ext = os.path.splitext(name)
+        fd, path = tempfile.mkstemp(
+            suffix=ext or ".jpg", prefix=f"{stem}-", dir=directory or None
+        )
+        os.close(fd)
+        return path
+
+    def _remove_temp_file(self, path: str) -> None:
+        """Remove a temporary screenshot file, ignoring errors."""
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -1,19 +1,46 @@
 """Status tracking service for application state."""
 
 import threading
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Callable, List, Optional
 from enum import Enum
 
 
 class AppStatus(Enum):
     """Application status enumeration."""
     STOPPED = "stopped"
+    LOADING = "loading"
     RUNNING = "running"
     PROCESSING = "processing"
     ERROR = "error"
 
 
+@dataclass(frozen=True, slots=True)
+class StatusSnapshot:
+    """Consistent point-in-time view of the fields shown in the UI."""
+
+    status: AppStatus
+    status_string: str
+    last_entry_preview: Optional[str]
+    last_entry_timestamp: Optional[datetime]
+
+
+def _status_to_string(status: AppStatus) -> str:
+    """Convert a status to a human-readable string."""
+    if status == AppStatus.RUNNING:
+        return "Running"
+    elif status == AppStatus.STOPPED:
+        return "Stopped"
+    elif status == AppStatus.LOADING:
+        return "Loading model..."
+    elif status == AppStatus.PROCESSING:
+        return "Processing..."
+    elif status == AppStatus.ERROR:
+        return "Error"
+    return "Unknown"
+
+
 class StatusService:
     """Service for tracking application state."""
 
@@ -25,7 +52,29 @@ class StatusService:
         self._last_entry_timestamp: Optional[datetime] = None
         self._error_count = 0
         self._next_execution_time: Optional[datetime] = None
+        # Single-field getters read without the lock (reference reads are atomic);
+        # it guards multi-field updates, read-modify-write and snapshots
         self._lock = threading.Lock()
+        self._callbacks: List[Callable[[], None]] = []
+
+    def on_change(self, callback: Callable[[], None]) -> None:
+        """
+        Register a callback invoked after the status or last entry changes.
+
+        Callbacks run synchronously on the thread that changed the status.
+
+        Args:
+            callback: Callable taking no arguments
+        """
+        with self._lock:
+            self._callbacks.append(callback)
+
+    def _notify_change(self) -> None:
+        """Invoke registered change callbacks outside the lock."""
+        with self._lock:
+            callbacks = list(self._callbacks)
+        for callback in callbacks:
+            callback()
 
     def set_status(self, status: AppStatus) -> None:
         """
@@ -35,7 +84,10 @@ class StatusService:
             status: Application status
         """
         with self._lock:
+            changed = self._status != status
             self._status = status
+        if changed:
+            self._notify_change()
 
     def get_status(self) -> AppStatus:
         """
@@ -44,8 +96,7 @@ class StatusService:
         Returns:
             Application status
         """
-        with self._lock:
-            return self._status
+        return self._status
 
     def is_running(self) -> bool:
         """
@@ -73,8 +124,7 @@ class StatusService:
         Returns:
             Last execution timestamp or None
         """
-        with self._lock:
-            return self._last_execution_time
+        return self._last_execution_time
 
     def set_last_entry(self, preview: str, timestamp: Optional[datetime] = None) -> None:
         """
@@ -87,6 +137,7 @@ class StatusService:
         with self._lock:
             self._last_entry_preview = preview[:100] if preview else None  # Limit to 100 chars
             self._last_entry_timestamp = timestamp or datetime.now()
+        self._notify_change()
 
     def get_last_entry_preview(self) -> Optional[str]:
         """
@@ -95,8 +146,7 @@ class StatusService:
         Returns:
             Last entry preview or None
         """
-        with self._lock:
-            return self._last_entry_preview
+        return self._last_entry_preview
 
     def get_last_entry_timestamp(self) -> Optional[datetime]:
         """
@@ -105,8 +155,7 @@ class StatusService:
         Returns:
             Last entry timestamp or None
         """
-        with self._lock:
-            return self._last_entry_timestamp
+        return self._last_entry_timestamp
 
     def increment_error_count(self) -> None:
         """Increment error count."""
@@ -125,8 +174,7 @@ class StatusService:
         Returns:
             Error count
         """
-        with self._lock:
-            return self._error_count
+        return self._error_count
 
     def set_next_execution_time(self, timestamp: Optional[datetime]) -> None:
         """
@@ -145,8 +193,7 @@ class StatusService:
         Returns:
             Next execution timestamp or None
         """
-        with self._lock:
-            return self._next_execution_time
+        return self._next_execution_time
 
     def get_status_string(self) -> str:
         """
@@ -155,16 +202,22 @@ class StatusService:
         Returns:
             Status string
         """
-        status = self.get_status()
-        if status == AppStatus.RUNNING:
-            return "Running"
-        elif status == AppStatus.STOPPED:
-            return "Stopped"
-        elif status == AppStatus.PROCESSING:
-            return "Processing..."
-        elif status == AppStatus.ERROR:
-            return "Error"
-        return "Unknown"
+        return _status_to_string(self.get_status())
+
+    def snapshot(self) -> StatusSnapshot:
+        """
+        Get status and last entry in a single lock acquisition.
+
+        Returns:
+            StatusSnapshot with mutually consistent fields
+        """
+        with self._lock:
+            return StatusSnapshot(
+                status=self._status,
+                status_string=_status_to_string(self._status),
+                last_entry_preview=self._last_entry_preview,
+                last_entry_timestamp=self._last_entry_timestamp,
+            )
 
     def get_status_info(self) -> dict:
         """
@@ -176,7 +229,7 @@ class StatusService:
         with self._lock:
             return {
                 "status": self._status.value,
-                "status_string": self.get_status_string(),
+                "status_string": _status_to_string(self._status),
                 "is_running": self._status == AppStatus.RUNNING,
                 "last_execution_time": (
                     self._last_execution_time.isoformat()
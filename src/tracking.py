@@ -1,9 +1,10 @@
 """Time tracking file logging module."""
 
+import atexit
 import os
-from datetime import datetime
+import time
 from pathlib import Path
-from typing import Optional
+from typing import IO, Optional, Tuple
 import threading
 
 from config import OUTPUT_FILE
@@ -23,7 +24,52 @@ class TrackingService:
         """
         self.output_file = output_file or OUTPUT_FILE
         self._lock = threading.Lock()
+        # Long-lived append handle, opened on first write
+        self._file: Optional[IO[str]] = None
+        self._file_path: Optional[str] = None
+        # (minute since epoch, formatted timestamp) of the last entry
+        self._timestamp_cache: Tuple[int, str] = (-1, "")
         self.logger = get_logging_service()
+        atexit.register(self.close)
+
+    def _get_file(self, check_rotation: bool = False) -> IO[str]:
+        """
+        Return the append handle, (re)opening it if needed (caller must hold _lock).
+
+        The file is reopened when output_file changed (config reload) or, if
+        check_rotation is set, when the file on disk was moved or deleted
+        (e.g. rotated).
+
+        Args:
+            check_rotation: Also stat the file to detect rotation
+        """
+        if self._file is not None and self._file_path != self.output_file:
+            self._file.close()
+            self._file = None
+
+        if self._file is not None and check_rotation:
+            try:
+                current = os.stat(self.output_file).st_ino
+            except FileNotFoundError:
+                current = None
+            if current != os.fstat(self._file.fileno()).st_ino:
+                self._file.close()
+                self._file = None
+
+        if self._file is None:
+            # Ensure directory exists
+            Path(self.output_file).parent.mkdir(parents=True, exist_ok=True)
+            # Line-buffered so each entry reaches the file as soon as it's written
+            self._file = open(self.output_file, "a", encoding="utf-8", buffering=1)
+            self._file_path = self.output_file
+        return self._file
+
+    def close(self) -> None:
+        """Close the output file handle, if open."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
 
     def append_entry(self, description: str) -> None:
         """
@@ -35,8 +81,15 @@ class TrackingService:
         Raises:
             IOError: If file writing fails
         """
-        # Format timestamp: YYYY.MM.DD HH:MM
-        timestamp = datetime.now().strftime("%Y.%m.%d %H:%M")
+        # Format timestamp: YYYY.MM.DD HH:MM (reformatted only when the minute changes)
+        now = time.time()
+        minute = int(now // 60)
+        cached_minute, timestamp = self._timestamp_cache
+        # Rotation is checked at most once a minute, not on every write
+        new_minute = minute != cached_minute
+        if new_minute:
+            timestamp = time.strftime("%Y.%m.%d %H:%M", time.localtime(now))
+            self._timestamp_cache = (minute, timestamp)
 
         # Format entry: timestamp description
         entry = f"{timestamp} {description}\n"
@@ -44,17 +97,19 @@ class TrackingService:
         # Thread-safe file writing
         with self._lock:
             try:
-                # Ensure directory exists
-                output_path = Path(self.output_file)
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-
                 # Append to file
-                with open(self.output_file, "a", encoding="utf-8") as f:
-                    f.write(entry)
+                self._get_file(check_rotation=new_minute).write(entry)
 
                 self.logger.info(f"Logged entry to {self.output_file}")
 
             except IOError as e:
+                # Drop the handle so the next entry reopens the file
+                if self._file is not None:
+                    try:
+                        self._file.close()
+                    except OSError:
+                        pass
+                    self._file = None
                 raise IOError(
                     f"Failed to write to tracking file {self.output_file}: {e}"
                 ) from e
@@ -0,0 +1,239 @@
+"""Workflow runner shared by the CLI and menu bar applications."""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from enum import Enum
+from typing import Any, Callable, List, Optional, Tuple
+
+from config import BATCH_MAX_SIZE, BATCH_TIMEOUT_SECONDS, CAPTURE_QUEUE_MAX_SIZE
+from src.logging_service import get_logging_service
+
+
+class WorkflowEvent(Enum):
+    """Workflow lifecycle event enumeration."""
+
+    STARTED = "started"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+def _drain_up_to(
+    requests: queue.Queue, max_items: int, timeout: float
+) -> List[Tuple[Any, Future]]:
+    """
+    Block for one request, then collect more until max_items or timeout.
+
+    Args:
+        requests: Queue of (image, future) requests
+        max_items: Maximum number of requests to return
+        timeout: Seconds to wait for additional requests after the first
+
+    Returns:
+        List of (image, future) requests, at least one
+    """
+    batch = [requests.get()]
+    deadline = time.monotonic() + timeout
+    while len(batch) < max_items:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        try:
+            batch.append(requests.get(timeout=remaining))
+        except queue.Empty:
+            break
+    return batch
+
+
+class WorkflowRunner:
+    """Runs the screenshot -> inference -> logging workflow."""
+
+    def __init__(
+        self,
+        screenshot_service: Any,
+        model_service: Any,
+        tracking_service: Any,
+        on_event: Optional[Callable[[WorkflowEvent, Optional[str]], None]] = None,
+        batched: bool = False,
+    ):
+        """
+        Initialize workflow runner.
+
+        Args:
+            screenshot_service: Service providing capture()
+            model_service: Service providing describe_image()/describe_images()
+            tracking_service: Service providing append_entry()
+            on_event: Optional callback receiving (event, detail). Detail is the
+                      description for COMPLETED and the error message for FAILED
+            batched: If True, captures are handed to a worker thread that runs
+                     inference and logging, batching queued captures together
+                     (see config.BATCH_MAX_SIZE and config.CAPTURE_QUEUE_MAX_SIZE)
+        """
+        self.screenshot_service = screenshot_service
+        self.model_service = model_service
+        self.tracking_service = tracking_service
+        self.on_event = on_event
+        self.logger = get_logging_service()
+
+        self._requests: Optional[queue.Queue] = None
+        if batched:
+            # Bounded so a slow model can't accumulate an unbounded backlog
+            self._requests = queue.Queue(maxsize=CAPTURE_QUEUE_MAX_SIZE)
+            self._worker = threading.Thread(
+                target=self._process_requests, daemon=True
+            )
+            self._worker.start()
+
+    def run(self) -> Optional[str]:
+        """
+        Execute the complete workflow: screenshot -> inference -> logging.
+
+        Blocks until the entry is logged. Errors are logged and reported
+        through on_event, not raised.
+
+        Returns:
+            Generated description, or None if the workflow failed
+        """
+        if self._requests is not None:
+            future = self.submit()
+            if future is None:
+                return None
+            try:
+                return future.result()
+            except Exception:
+                return None
+
+        image = self._capture()
+        if image is None:
+            return None
+
+        try:
+            # Step 2: Run model inference
+            self.logger.info("Step 2: Running model inference...")
+            description = self.model_service.describe_image(image)
+        except Exception as e:
+            self._fail(e)
+            return None
+
+        return self._complete(description)
+
+    def submit(self) -> Optional[Future]:
+        """
+        Capture a screenshot and queue it for inference and logging.
+
+        Returns as soon as the screenshot is queued, so capture overlaps with
+        inference of earlier captures. Requires batched=True.
+
+        Returns:
+            Future resolving to the description (or the inference error),
+            or None if the capture failed or the queue was full
+        """
+        if self._requests is None:
+            raise RuntimeError("submit() requires a batched WorkflowRunner")
+
+        # Cheap pre-check so a full backlog doesn't cost a capture
+        if self._requests.full():
+            self.logger.warning("Inference backlog is full, skipping this capture")
+            return None
+
+        image = self._capture()
+        if image is None:
+            return None
+
+        # Another capture may have taken the last slot meanwhile; never block here.
+        # The in-flight requests still emit COMPLETED/FAILED for the status.
+        future: Future = Future()
+        try:
+            self._requests.put_nowait((image, future))
+        except queue.Full:
+            self.logger.warning("Inference backlog is full, dropping this capture")
+            return None
+        return future
+
+    def _capture(self) -> Optional[Any]:
+        """Start the workflow and capture a screenshot (None on failure)."""
+        try:
+            self._emit(WorkflowEvent.STARTED, None)
+            self.logger.info("Starting workflow execution...")
+
+            # Step 1: Capture screenshot
+            self.logger.info("Step 1: Capturing screenshot...")
+            image = self.screenshot_service.capture()
+            self.logger.info("✓ Screenshot captured successfully")
+            return image
+        except Exception as e:
+            self._fail(e)
+            return None
+
+    def _complete(self, description: str) -> Optional[str]:
+        """Log the description to the tracking file and report completion."""
+        try:
+            self.logger.info(f"✓ Inference completed: {description[:100]}...")
+
+            # Step 3: Log to tracking file
+            self.logger.info("Step 3: Logging to tracking file...")
+            self.tracking_service.append_entry(description)
+            self.logger.info("✓ Entry logged successfully")
+        except Exception as e:
+            self._fail(e)
+            return None
+
+        # The entry is written; a failing callback doesn't make this a failed run
+        self.logger.info("Workflow completed successfully!")
+        self._emit(WorkflowEvent.COMPLETED, description)
+        return description
+
+    def _fail(self, error: Exception) -> None:
+        """Log a workflow error and report it (call from an except block)."""
+        self.logger.exception(f"Error in workflow execution: {error}")
+        self._emit(WorkflowEvent.FAILED, str(error))
+
+    def _emit(self, event: WorkflowEvent, detail: Optional[str]) -> None:
+        """Forward an event to the on_event callback, if any, logging its errors."""
+        if not self.on_event:
+            return
+        try:
+            self.on_event(event, detail)
+        except Exception as e:
+            # Must not propagate: on the worker thread it would end the loop
+            self.logger.exception(f"Error in workflow {event.value} callback: {e}")
+
+    def _process_requests(self) -> None:
+        """Worker loop: describe queued captures in batches, then log each one."""
+        while True:
+            requests = _drain_up_to(
+                self._requests, BATCH_MAX_SIZE, BATCH_TIMEOUT_SECONDS
+            )
+            try:
+                self._process_batch(requests)
+            except Exception as e:
+                # Keep the worker alive and make sure no caller waits forever
+                for _, future in requests:
+                    if not future.done():
+                        self._fail(e)
+                        future.set_exception(e)
+
+    def _process_batch(self, requests: List[Tuple[Any, Future]]) -> None:
+        """Describe one batch of queued captures and log each description."""
+        if len(requests) > 1:
+            self.logger.info(f"Describing {len(requests)} queued captures together")
+
+        # Step 2: Run model inference
+        self.logger.info("Step 2: Running model inference...")
+        images = [image for image, _ in requests]
+        try:
+            descriptions = self.model_service.describe_images(images)
+        except Exception as e:
+            for _, future in requests:
+                self._fail(e)
+                future.set_exception(e)
+            return
+
+        for (_, future), description in zip(requests, descriptions, strict=True):
+            if self._complete(description) is None:
+                future.set_exception(
+                    RuntimeError("Failed to log the workflow entry")
+                )
+            else:
+                future.set_result(description)